@@ -0,0 +1,98 @@
+"""Analyze upper/lower arm rotation tracking from a motion debug log.
+
+Reads the latest log/motion-debug-log-*.json and reports per-bone rotation
+statistics plus likely tracking issues (stuck axes, collapsed range, etc.).
+"""
+import numpy as np
+
+from log_loader import latest_log_path, load
+from motion_stats import col_stats
+
+# Bone axes reported below.
+COLUMNS = [
+    ('RightUpperArm', 'x'),
+    ('RightUpperArm', 'y'),
+    ('RightUpperArm', 'z'),
+    ('LeftUpperArm', 'x'),
+    ('LeftUpperArm', 'y'),
+    ('LeftUpperArm', 'z'),
+    ('RightLowerArm', 'z'),
+    ('LeftLowerArm', 'z'),
+]
+
+
+def analyze_rotation_data(name, st, j):
+    """Print statistics for column j of a ColStats and return (avg, range)."""
+    if st.valid[j] == 0:
+        print(f"  {name}: no data")
+        return None
+    avg = st.means[j]
+    lo = st.mins[j]
+    hi = st.maxs[j]
+    rng = hi - lo
+    avg_d, lo_d, hi_d, rng_d = np.rad2deg([avg, lo, hi, rng])
+    print(f"  {name}:")
+    print(f"    avg:    {avg:.3f} rad ({avg_d:.1f} deg)")
+    print(f"    min:    {lo:.3f} rad ({lo_d:.1f} deg)")
+    print(f"    max:    {hi:.3f} rad ({hi_d:.1f} deg)")
+    print(f"    range:  {rng:.3f} rad ({rng_d:.1f} deg)")
+    print(f"    avg frame-to-frame change: {st.mean_rate[j]:.4f} rad")
+    return avg, rng
+
+
+def main():
+    log_file = latest_log_path()
+    if log_file is None:
+        print("No log files found in log/")
+        return
+    print(f"Analyzing: {log_file}")
+
+    arrs = load(log_file)
+    print(f"Frames: {len(arrs)}")
+
+    print("\n=== Arm rotation statistics ===")
+    X = np.stack([arrs.column(bone, axis) for bone, axis in COLUMNS], axis=1)
+    st = col_stats(X)
+    stats = {}
+    for j, (bone, axis) in enumerate(COLUMNS):
+        stats[(bone, axis)] = analyze_rotation_data(f"{bone}.{axis}", st, j)
+
+    print("\n=== Issue detection ===")
+
+    def stat(bone, idx, sign=1.0):
+        entry = stats.get((bone, 'z'))
+        return sign * entry[idx] if entry is not None else np.nan
+
+    # Sign-normalized so every check is "value < threshold"; bones with
+    # no data are NaN and never fire. One vectorized comparison replaces
+    # the per-limb if-chains.
+    AVG, RNG = 0, 1
+    checks = [
+        (stat('RightUpperArm', AVG), -0.5,
+         "RightUpperArm.z average is strongly negative "
+         "(arm may be stuck lowered)"),
+        (stat('RightUpperArm', RNG), 1.0,
+         "RightUpperArm.z range is narrow (raising the arm may not track)"),
+        (stat('LeftUpperArm', AVG, sign=-1.0), -0.5,
+         "LeftUpperArm.z average is strongly positive "
+         "(arm may be stuck lowered)"),
+        (stat('LeftUpperArm', RNG), 1.0,
+         "LeftUpperArm.z range is narrow (raising the arm may not track)"),
+        (stat('RightLowerArm', RNG, sign=-1.0), -2.5,
+         "RightLowerArm.z range is very wide (possible jitter)"),
+        (stat('LeftLowerArm', RNG), 0.3,
+         "LeftLowerArm.z barely moves (elbow may not track)"),
+    ]
+    values = np.array([c[0] for c in checks])
+    thresholds = np.array([c[1] for c in checks])
+    fails = np.nonzero(values < thresholds)[0]
+
+    if fails.size:
+        for i in fails:
+            print(f"  - {checks[i][2]}")
+    else:
+        print("  No obvious issues detected.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""Detect Y->Z rotation crosstalk on the upper arms from a motion debug log.
+
+Swinging an arm forward/back (Y) should not leak into the raise/lower
+axis (Z); this script measures how much Z moves whenever Y moves.
+"""
+import numpy as np
+
+from log_loader import latest_log_path, load, smoothed_rates
+
+Y_MOVE_THRESHOLD = 0.01  # rad per frame
+
+
+def main():
+    log_file = latest_log_path()
+    if log_file is None:
+        print("No log files found in log/")
+        return
+    print(f"Analyzing: {log_file}")
+
+    arrs = load(log_file)
+    print(f"Frames: {len(arrs)}")
+
+    # Paired Y/Z series per side, keeping only frames where both axes
+    # were present so the diffs stay aligned.
+    sides = {}
+    for side, bone in (('Right', 'RightUpperArm'), ('Left', 'LeftUpperArm')):
+        y = arrs.column(bone, 'y')
+        z = arrs.column(bone, 'z')
+        m = ~(np.isnan(y) | np.isnan(z))
+        sides[side] = (y[m], z[m])
+
+    print("\n=== Rotation ranges ===")
+    for side, (y, z) in sides.items():
+        for axis, vals in (('y', y), ('z', z)):
+            name = f"{side}UpperArm.{axis}"
+            if vals.size == 0:
+                print(f"  {name}: no data")
+                continue
+            lo, hi = vals.min(), vals.max()
+            print(f"  {name}: min {lo:.3f}  max {hi:.3f}  "
+                  f"range {np.ptp(vals):.3f} rad")
+
+    print("\n=== Y -> Z crosstalk ===")
+    for side, (y, z) in sides.items():
+        if y.size < 2:
+            print(f"  {side}: not enough data")
+            continue
+        # Smoothed rates (when SciPy is present) so sensor noise is not
+        # counted as Y motion; both series go through the same path so
+        # the samples stay aligned.
+        yd = smoothed_rates(y)
+        zd = smoothed_rates(z)
+        mask = yd > Y_MOVE_THRESHOLD
+        if not mask.any():
+            print(f"  {side}: Y axis never moved")
+            continue
+        avg_y = yd[mask].mean()
+        avg_z = zd[mask].mean()
+        max_z = zd[mask].max()
+        ratio = avg_z / avg_y
+        print(f"  {side}: frames with Y motion: {int(mask.sum())}")
+        print(f"    avg |dY|: {avg_y:.4f}  avg |dZ| while Y moves: {avg_z:.4f}")
+        print(f"    max |dZ| while Y moves: {max_z:.4f}")
+        print(f"    crosstalk ratio (dZ/dY): {ratio:.2f}")
+        if ratio > 0.5:
+            print(f"    WARNING: strong Y->Z crosstalk on {side} upper arm")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""Analyze finger bone tracking from a motion debug log.
+
+Builds one (N_frames, N_bones) matrix of finger z rotations and reports
+per-bone range, jitter and peak frame-to-frame speed for all 30 bones.
+"""
+import numpy as np
+
+from log_loader import latest_log_path, load, smoothed_rates
+from motion_stats import col_stats
+
+FINGERS = ['Thumb', 'Index', 'Middle', 'Ring', 'Little']
+PARTS = ['Proximal', 'Intermediate', 'Distal']
+
+BONE_NAMES = [
+    f'{hand}{finger}{part}'
+    for hand in ('right', 'left')
+    for finger in FINGERS
+    for part in PARTS
+]
+
+LARGE_CHANGE_THRESHOLD = 0.1  # rad per frame
+
+
+def finger_matrix(arrs):
+    """Stack the 30 finger z columns from the shared loader into (N, 30)."""
+    Z = np.full((len(arrs), len(BONE_NAMES)), np.nan, dtype=np.float64)
+    for j, bone in enumerate(BONE_NAMES):
+        Z[:, j] = arrs.column(bone, 'z')
+    return Z
+
+
+def main():
+    log_file = latest_log_path()
+    if log_file is None:
+        print("No log files found in log/")
+        return
+    print(f"Analyzing: {log_file}")
+
+    arrs = load(log_file)
+    Z = finger_matrix(arrs)
+    print(f"Frames: {len(Z)}")
+
+    # All statistics come from the shared fused column kernel: one pass
+    # over the matrix, no further passes over the parsed frames.
+    st = col_stats(Z, LARGE_CHANGE_THRESHOLD)
+    mins, maxs, valid = st.mins, st.maxs, st.valid
+    ranges = maxs - mins
+    large_changes = st.large_changes
+    max_speed = st.max_rate
+
+    # Rate stats from the smoothed derivative when SciPy is available:
+    # point-to-point diffs flag landmark noise as "large changes". The
+    # length check only identifies the smoothed path for non-empty logs
+    # (diff keeps length 0 at N == 0), hence the explicit len guard.
+    if len(Z):
+        rates = smoothed_rates(Z)
+        if rates.shape[0] == Z.shape[0]:  # smoothed path taken
+            large_changes = np.nansum(rates > LARGE_CHANGE_THRESHOLD,
+                                      axis=0)
+            # savgol propagates NaN across its whole window, so a
+            # sparsely tracked bone can leave a smoothed column with
+            # no samples at all. Gate on the rates' own validity and
+            # keep the kernel's gap-skipping max_rate for columns the
+            # smoothed path cannot cover.
+            covered = ~np.isnan(rates).all(axis=0)
+            if covered.any():
+                max_speed = np.array(st.max_rate, copy=True)
+                max_speed[covered] = np.nanmax(rates[:, covered], axis=0)
+
+    # Convert whole stat arrays to degrees once instead of per-print calls.
+    mins_deg = np.rad2deg(mins)
+    maxs_deg = np.rad2deg(maxs)
+
+    print("\n=== Finger bone statistics (z rotation) ===")
+    for j, bone in enumerate(BONE_NAMES):
+        if valid[j] == 0:
+            print(f"  {bone}: no data")
+            continue
+        print(f"  {bone}:")
+        print(f"    range: {ranges[j]:.3f} rad "
+              f"({mins_deg[j]:.1f} to {maxs_deg[j]:.1f} deg)")
+        print(f"    large changes (>{LARGE_CHANGE_THRESHOLD} rad/frame): "
+              f"{int(large_changes[j])}")
+        print(f"    max speed: {max_speed[j]:.3f} rad/frame")
+
+    print("\n=== Summary ===")
+    tracked = valid > 0
+    print(f"  Bones with data: {int(tracked.sum())}/{len(BONE_NAMES)}")
+    if tracked.any():
+        frozen = tracked & (ranges < 0.01)
+        jittery = tracked & (large_changes > len(Z) * 0.1)
+        if frozen.any():
+            names = [BONE_NAMES[j] for j in np.nonzero(frozen)[0]]
+            print(f"  Frozen bones (range < 0.01 rad): {', '.join(names)}")
+        if jittery.any():
+            names = [BONE_NAMES[j] for j in np.nonzero(jittery)[0]]
+            print(f"  Jittery bones: {', '.join(names)}")
+
+
+if __name__ == '__main__':
+    main()
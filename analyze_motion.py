@@ -0,0 +1,75 @@
+"""Overall motion quality report from a motion debug log.
+
+Covers raw landmark stability (wrists/elbows), upper arm rotation
+smoothness and frame timing consistency.
+"""
+import numpy as np
+
+from log_loader import latest_log_path, load
+
+# Mediapipe pose landmark indices.
+LEFT_ELBOW = 13
+RIGHT_ELBOW = 14
+LEFT_WRIST = 15
+RIGHT_WRIST = 16
+
+
+def calculate_smoothness(positions):
+    """Mean absolute second derivative; lower is smoother."""
+    positions = np.asarray(positions, dtype=np.float64)
+    if positions.size < 3:
+        return 0.0
+    return float(np.abs(np.diff(positions, n=2)).mean())
+
+
+def main():
+    log_file = latest_log_path()
+    if log_file is None:
+        print("No log files found in log/")
+        return
+    print(f"Analyzing: {log_file}")
+
+    # One traversal of the log happens inside the loader; everything below
+    # slices the cached columnar arrays.
+    arrs = load(log_file)
+    print(f"Frames: {len(arrs)}")
+
+    print("\n=== Raw landmark stability (Y) ===")
+    for name, idx in (('left wrist', LEFT_WRIST),
+                      ('right wrist', RIGHT_WRIST),
+                      ('left elbow', LEFT_ELBOW),
+                      ('right elbow', RIGHT_ELBOW)):
+        col = arrs.landmark_y[:, idx]
+        vals = col[~np.isnan(col)]
+        if vals.size < 2:
+            print(f"  {name}: no data")
+            continue
+        print(f"  {name}: mean {vals.mean():.3f}  "
+              f"stdev {vals.std(ddof=1):.4f}  "
+              f"range {np.ptp(vals):.3f}")
+
+    print("\n=== Arm rotation smoothness ===")
+    for bone in ('RightUpperArm', 'LeftUpperArm'):
+        vals = arrs.valid_column(bone, 'z')
+        if vals.size < 3:
+            print(f"  {bone}.z: no data")
+            continue
+        print(f"  {bone}.z: smoothness {calculate_smoothness(vals):.5f}  "
+              f"range {np.ptp(vals):.3f} rad")
+
+    print("\n=== Frame timing ===")
+    t = arrs.t[~np.isnan(arrs.t)]
+    frame_times = np.diff(t)
+    if frame_times.size > 1:
+        avg = frame_times.mean()
+        sd = frame_times.std(ddof=1)
+        print(f"  avg interval: {avg:.1f} ms ({1000.0 / avg:.1f} fps)")
+        print(f"  interval stdev: {sd:.1f} ms")
+        if sd > avg * 0.5:
+            print("  WARNING: frame timing is unstable")
+    else:
+        print("  no timing data")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""Inspect right thumb rotation values from the latest motion log."""
+import numpy as np
+
+from log_loader import frames_to_soa, latest_log_path, load_log
+
+THUMB_BONES = ['rightThumbProximal', 'rightThumbIntermediate',
+               'rightThumbDistal']
+_RAD2DEG = 180.0 / 3.141592653589793  # degrees per radian
+LOG_PREFIXES = ('motion-debug-log-', 'motion-capture-')
+
+
+def main():
+    log_file = latest_log_path(prefix=LOG_PREFIXES)
+    if log_file is None:
+        print("No log files found in log/")
+        return
+    print(f"Analyzing: {log_file}")
+
+    data = load_log(log_file)
+    print(f"Frames: {len(data)}")
+
+    # Everything below reads vectorized reductions and slices of the
+    # shared SoA fill; there is no per-bone dict-of-lists left to
+    # append into.
+    vals = frames_to_soa(data, THUMB_BONES)
+
+    print("\n=== Right thumb statistics ===")
+    for j, bone in enumerate(THUMB_BONES):
+        if np.all(np.isnan(vals[:, j, 2])):
+            print(f"  {bone}: no data")
+            continue
+        print(f"  {bone}:")
+        for name, k in (('z', 2), ('x', 0)):
+            col = vals[:, j, k]
+            avg = np.nanmean(col)
+            print(f"    {name}: min {np.nanmin(col):.3f}  "
+                  f"max {np.nanmax(col):.3f}  "
+                  f"avg {avg:.3f} rad ({avg * _RAD2DEG:.1f} deg)")
+
+    print("\n=== Sign diagnosis (first 10 frames, proximal z) ===")
+    # Compacting the proximal-z column drops untracked frames, matching
+    # what the old append lists collected.
+    proximal_z = vals[:, 0, 2]
+    first_10_z = proximal_z[~np.isnan(proximal_z)][:10]
+    if first_10_z.size:
+        print(f"  values: {[f'{z:.3f}' for z in first_10_z]}")
+        # Branchless sign test: one signbit pass instead of two
+        # short-circuiting generator scans.
+        negative = np.signbit(first_10_z)
+        if not negative.any():
+            print("  All positive: thumb likely bending outward "
+                  "(check axis sign for the right hand)")
+        elif negative.all():
+            print("  All negative: sign convention looks correct")
+        else:
+            print("  Mixed signs: thumb direction is unstable")
+    else:
+        print("  no data")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Inspect left thumb rotations and per-finger proximal stats from a log."""
+import numpy as np
+
+from log_loader import frames_to_soa, latest_log_path, load_log
+
+THUMB_BONES = ['leftThumbProximal', 'leftThumbIntermediate',
+               'leftThumbDistal']
+FINGERS = ['Thumb', 'Index', 'Middle', 'Ring', 'Little']
+_RAD2DEG = 180.0 / 3.141592653589793  # degrees per radian
+
+
+def main():
+    log_file = latest_log_path()
+    if log_file is None:
+        print("No log files found in log/")
+        return
+    print(f"Analyzing: {log_file}")
+
+    data = load_log(log_file)
+    print(f"Frames: {len(data)}")
+
+    # Frames where any thumb bone was tracked. The membership check runs
+    # before any dict is built, so untracked frames (usually most of the
+    # log) allocate nothing.
+    thumb_frames = []
+    for i, frame in enumerate(data):
+        inp = frame.get('input')
+        if not inp:
+            continue
+        present = [bone for bone in THUMB_BONES if bone in inp]
+        if not present:
+            continue
+        thumb_frame = {'frame': i}
+        for bone in present:
+            thumb_frame[bone] = inp[bone]
+        thumb_frames.append(thumb_frame)
+
+    print(f"\nFrames with thumb data: {len(thumb_frames)}")
+    print("\n=== First thumb samples ===")
+    r2d = _RAD2DEG
+    for tf in thumb_frames[:5]:
+        print(f"  frame {tf['frame']}:")
+        for bone in THUMB_BONES:
+            if bone in tf:
+                rot = tf[bone]
+                z = rot.get('z', 0)
+                print(f"    {bone}: z {z:.3f} rad "
+                      f"({z * r2d:.1f} deg)")
+
+    print("\n=== Per-finger proximal stats (left hand) ===")
+    # The shared SoA fill walks the frames once for all fingers; the
+    # previous version re-iterated the whole log once per finger.
+    proximal_bones = [f'left{finger}Proximal' for finger in FINGERS]
+    vals = frames_to_soa(data, proximal_bones)
+
+    for j, finger in enumerate(FINGERS):
+        if np.all(np.isnan(vals[:, j, 2])):
+            print(f"  {finger}: no data")
+            continue
+        for axis, k in (('x', 0), ('z', 2)):
+            col = vals[:, j, k]
+            avg = np.nanmean(col)
+            print(f"  {finger}.{axis}: min {np.nanmin(col):.3f}  "
+                  f"max {np.nanmax(col):.3f}  "
+                  f"avg {avg:.3f} rad ({avg * _RAD2DEG:.1f} deg)")
+
+
+if __name__ == '__main__':
+    main()
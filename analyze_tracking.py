@@ -0,0 +1,116 @@
+"""Compare solver input rotations against applied VRM output rotations.
+
+Reports per bone/axis how far the applied output drifts from the solver
+input across the log.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from log_loader import latest_log_path, load_log
+from motion_stats import diff_stats
+
+BONES = ['RightUpperArm', 'RightLowerArm', 'LeftUpperArm', 'LeftLowerArm']
+AXES = ['x', 'y', 'z']
+_RAD2DEG = 180.0 / 3.141592653589793  # degrees per radian
+
+
+# Below this many difference samples the thread-pool handoff costs more
+# than the reductions themselves.
+_PARALLEL_MIN_SIZE = 1_000_000
+
+
+def _reduce(d):
+    """Stats for one bone/axis difference column.
+
+    Returns (n, avg, max, c001, c01, c1) with NaN frames dropped, or
+    None when the column has no data. With numba the whole column is
+    reduced in one fused scan instead of five NumPy passes.
+    """
+    return diff_stats(d)
+
+
+def reduce_all(diff):
+    """Run _reduce over every (bone, axis) column of diff.
+
+    The twelve reductions are independent and release the GIL while
+    they run (NumPy reductions on the fallback path, a nogil kernel on
+    the numba path), so large logs fan them out over a thread pool;
+    small logs stay serial to skip the pool overhead.
+    """
+    cols = [diff[:, b, a]
+            for b in range(diff.shape[1]) for a in range(diff.shape[2])]
+    if diff.size > _PARALLEL_MIN_SIZE:
+        with ThreadPoolExecutor() as ex:
+            return list(ex.map(_reduce, cols))
+    return [_reduce(col) for col in cols]
+
+
+def out_key(bone):
+    """Output dict uses lowerCamelCase bone names."""
+    return bone[0].lower() + bone[1:]
+
+
+def extract_paired(data):
+    """One pass filling an (N, bones, axes, {input,output}) tensor.
+
+    Every report below reads reductions of this contiguous float32 block
+    instead of re-walking the JSON dict tree.
+    """
+    paired = np.full((len(data), len(BONES), len(AXES), 2), np.nan,
+                     dtype=np.float32)
+    for i, frame in enumerate(data):
+        if 'input' in frame and 'output' in frame:
+            inp = frame['input']
+            out = frame['output']
+            for b, bone in enumerate(BONES):
+                key = out_key(bone)
+                if bone in inp and key in out:
+                    ib = inp[bone]
+                    ob = out[key]
+                    for a, axis in enumerate(AXES):
+                        paired[i, b, a, 0] = ib.get(axis, 0)
+                        paired[i, b, a, 1] = ob.get(axis, 0)
+    return paired
+
+
+def main():
+    log_file = latest_log_path()
+    if log_file is None:
+        print("No log files found in log/")
+        return
+    print(f"Analyzing: {log_file}")
+
+    data = load_log(log_file)
+    print(f"Frames: {len(data)}")
+
+    paired = extract_paired(data)
+    diff = np.abs(paired[..., 0] - paired[..., 1])  # (N, bones, axes)
+
+    print("\n=== First 10 frames (RightUpperArm.z) ===")
+    ruz = paired[:, 0, 2, :]
+    r2d = _RAD2DEG
+    for i in np.nonzero(~np.isnan(ruz[:, 0]))[0][:10]:
+        iz, oz = ruz[i]
+        print(f"  frame {i}: in {iz:.3f} ({iz * r2d:.1f} deg)"
+              f"  out {oz:.3f} ({oz * r2d:.1f} deg)")
+
+    print("\n=== Input/output differences ===")
+    stats = reduce_all(diff)
+    for b, bone in enumerate(BONES):
+        print(f"  {bone}:")
+        for a, axis in enumerate(AXES):
+            st = stats[b * len(AXES) + a]
+            if st is None:
+                print(f"    {axis}: no data")
+                continue
+            n, avg, mx, c001, c01, c1 = st
+            print(f"    {axis}: avg {avg:.4f}  max {mx:.4f} rad "
+                  f"({mx * _RAD2DEG:.1f} deg)")
+            print(f"       <0.001: {c001}/{n}  "
+                  f"<0.01: {c01}/{n}  "
+                  f"<0.1: {c1}/{n}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""Quick check of RightUpperArm x/z axis values across a log."""
+from operator import itemgetter
+
+from log_loader import iter_frames, latest_log_path
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional speedup
+    ijson = None
+
+
+def iter_right_upper_arm(path):
+    """Yield RightUpperArm rotation dicts straight from the parser.
+
+    Only this one path is needed per frame; with ijson the rest of each
+    frame dict is never built at all.
+    """
+    if ijson is not None:
+        with open(path, 'rb') as f:
+            yield from ijson.items(f, 'item.input.RightUpperArm')
+        return
+    for frame in iter_frames(path):
+        inp = frame.get('input')
+        if inp and 'RightUpperArm' in inp:
+            yield inp['RightUpperArm']
+
+
+def main():
+    log_file = latest_log_path()
+    if log_file is None:
+        print("No log files found in log/")
+        return
+    print(f"Analyzing: {log_file}")
+
+    # itemgetter pulls both axes out of each rot dict in one C-level
+    # call, so the stream is consumed exactly once with no per-sample
+    # Python attribute lookups.
+    get_xz = itemgetter('x', 'z')
+    pairs = list(map(get_xz, iter_right_upper_arm(log_file)))
+
+    if not pairs:
+        print("No RightUpperArm data in log")
+        return
+    x_values, z_values = zip(*pairs)
+
+    print(f"Samples: {len(x_values)}")
+    print(f"x: min {min(x_values):.3f}  max {max(x_values):.3f}")
+    print(f"z: min {min(z_values):.3f}  max {max(z_values):.3f}")
+
+    print("\nFirst 20 samples (x, z):")
+    for x, z in zip(x_values[:20], z_values[:20]):
+        print(f"  {x:7.3f}  {z:7.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Check average finger curl direction per hand from a motion log.
+
+Opposite-sign averages between hands usually mean a mirrored axis in the
+finger rigging.
+"""
+from log_loader import latest_log_path, load_log
+
+FINGERS = ['Thumb', 'Index', 'Middle', 'Ring', 'Little']
+PARTS = ['Proximal', 'Intermediate', 'Distal']
+_RAD2DEG = 180.0 / 3.141592653589793  # degrees per radian
+
+# All 30 (hand, finger, part, bone-name) combinations built once; the
+# frame loop then looks up interned keys instead of re-building 30
+# f-strings per frame.
+BONE_TABLE = [
+    (hand, finger, part, f'{hand}{finger}{part}')
+    for hand in ('right', 'left')
+    for finger in FINGERS
+    for part in PARTS
+]
+
+
+def main():
+    log_file = latest_log_path()
+    if log_file is None:
+        print("No log files found in log/")
+        return
+    print(f"Analyzing: {log_file}")
+
+    data = load_log(log_file)
+    print(f"Frames: {len(data)}")
+
+    totals = {}  # bone name -> [sum_z, count]
+    for frame in data:
+        frame_input = frame.get('input')
+        if not frame_input:
+            continue
+        for hand, finger, part, name in BONE_TABLE:
+            rot = frame_input.get(name)
+            if rot is not None:
+                z = rot.get('z', 0)
+                if name not in totals:
+                    totals[name] = [0.0, 0]
+                totals[name][0] += z
+                totals[name][1] += 1
+
+    print("\n=== Average curl (z) per bone ===")
+    current_hand = None
+    for hand, finger, part, name in BONE_TABLE:
+        if hand != current_hand:
+            print(f"  {hand}:")
+            current_hand = hand
+        if name not in totals or totals[name][1] == 0:
+            continue
+        avg = totals[name][0] / totals[name][1]
+        print(f"    {finger}{part}: {avg:.3f} rad "
+              f"({avg * _RAD2DEG:.1f} deg)")
+
+    print("\n=== Hand comparison (proximal averages) ===")
+    for finger in FINGERS:
+        r = totals.get(f'right{finger}Proximal')
+        l = totals.get(f'left{finger}Proximal')
+        if not r or not l or not r[1] or not l[1]:
+            continue
+        r_avg = r[0] / r[1]
+        l_avg = l[0] / l[1]
+        flag = "  <- opposite signs!" if r_avg * l_avg < 0 else ""
+        print(f"  {finger}: right {r_avg:.3f}  left {l_avg:.3f}{flag}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""Check upper arm Y-axis swing on both sides from a motion log."""
+import numpy as np
+
+from log_loader import latest_log_path, load_log
+
+BONES = ('RightUpperArm', 'LeftUpperArm')
+LARGE_CHANGE = 0.1  # rad per frame
+_RAD2DEG = 180.0 / 3.141592653589793  # degrees per radian
+
+
+def report(bone, values):
+    """Print swing stats for one bone's compacted y samples."""
+    print(f"\n=== {bone}.y ===")
+    if not values.size:
+        print("  no data")
+        return
+    avg = values.mean()
+    print(f"  samples: {values.size}")
+    print(f"  min {values.min():.3f}  max {values.max():.3f}"
+          f"  avg {avg:.3f} rad ({avg * _RAD2DEG:.1f} deg)")
+    big = int((np.abs(np.diff(values)) > LARGE_CHANGE).sum())
+    print(f"  large changes (>{LARGE_CHANGE} rad/frame): {big}")
+
+
+def main():
+    log_file = latest_log_path()
+    if log_file is None:
+        print("No log files found in log/")
+        return
+    data = load_log(log_file)
+    print(f"Analyzing: {log_file}")
+    print(f"Frames: {len(data)}")
+
+    # One walk over the frames fills both sides' pre-sized buffers; the
+    # old version duplicated the whole loop per arm.
+    bufs = {bone: np.empty(len(data), dtype=np.float32) for bone in BONES}
+    counts = {bone: 0 for bone in BONES}
+    for frame in data:
+        inp = frame.get('input')
+        if not inp:
+            continue
+        for bone in BONES:
+            rot = inp.get(bone)
+            if rot is not None:
+                bufs[bone][counts[bone]] = rot.get('y', 0)
+                counts[bone] += 1
+
+    for bone in BONES:
+        report(bone, bufs[bone][:counts[bone]])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""Dump right arm landmarks and rotations for a few sample frames.
+
+Used to sanity-check the Z axis sign against the raw landmark positions.
+"""
+from log_loader import iter_frames, latest_log_path
+
+# Mediapipe pose landmark indices.
+RIGHT_SHOULDER = 12
+RIGHT_ELBOW = 14
+RIGHT_WRIST = 16
+
+SAMPLE_FRAMES = [10, 50, 100]
+
+
+def dump_frame(idx, frame):
+    print(f"\n=== frame {idx} ===")
+    lms = frame.get('rawLandmarks')
+    if lms and len(lms) > RIGHT_WRIST:
+        for name, li in (('shoulder', RIGHT_SHOULDER),
+                         ('elbow', RIGHT_ELBOW),
+                         ('wrist', RIGHT_WRIST)):
+            lm = lms[li]
+            print(f"  {name}: x {lm['x']:.3f}  y {lm['y']:.3f}  "
+                  f"z {lm['z']:.3f}")
+    inp = frame.get('input', {})
+    for bone in ('RightUpperArm', 'RightLowerArm'):
+        rot = inp.get(bone)
+        if rot:
+            print(f"  {bone}: z {rot.get('z', 0):.3f} rad")
+
+
+def main():
+    log_file = latest_log_path()
+    if log_file is None:
+        print("No log files found in log/")
+        return
+    print(f"Analyzing: {log_file}")
+
+    # Stream and stop at the last sample index: only three frames are
+    # needed, so the bulk of the log is never parsed into dicts.
+    wanted = set(SAMPLE_FRAMES)
+    last = max(SAMPLE_FRAMES)
+    for idx, frame in enumerate(iter_frames(log_file)):
+        if idx in wanted:
+            dump_frame(idx, frame)
+        if idx >= last:
+            break
+
+
+if __name__ == '__main__':
+    main()
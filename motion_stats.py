@@ -0,0 +1,161 @@
+"""Fused per-column statistics kernel shared by the analyze scripts.
+
+Given an (N, K) matrix of per-frame values (NaN where missing), computes
+min / max / mean / frame-to-frame rate stats / large-change counts for
+every column in a single pass. With numba the whole pass compiles to one
+SIMD-friendly loop per column; without it a nan-aware NumPy fallback
+produces identical results.
+"""
+import warnings
+from collections import namedtuple
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - optional speedup
+    numba = None
+
+ColStats = namedtuple(
+    'ColStats',
+    ['mins', 'maxs', 'means', 'mean_rate', 'max_rate',
+     'large_changes', 'valid'])
+
+
+if numba is not None:
+    @numba.njit(cache=True, parallel=True)
+    def _col_stats_jit(X, thresh):
+        # Columns are independent reductions with distinct output slots,
+        # so prange parallelizes them with no synchronization or false
+        # sharing; each thread scans its own contiguous column.
+        n, m = X.shape
+        mins = np.full(m, np.nan)
+        maxs = np.full(m, np.nan)
+        means = np.full(m, np.nan)
+        mean_rate = np.zeros(m)
+        max_rate = np.zeros(m)
+        large = np.zeros(m, np.int64)
+        valid = np.zeros(m, np.int64)
+        for j in numba.prange(m):
+            s = 0.0
+            mn = np.inf
+            mx = -np.inf
+            cnt = 0
+            ds = 0.0
+            dcnt = 0
+            dmx = 0.0
+            lg = 0
+            for i in range(n):
+                v = X[i, j]
+                if np.isnan(v):
+                    continue
+                cnt += 1
+                s += v
+                if v < mn:
+                    mn = v
+                if v > mx:
+                    mx = v
+                if i > 0:
+                    p = X[i - 1, j]
+                    if not np.isnan(p):
+                        d = abs(v - p)
+                        ds += d
+                        dcnt += 1
+                        if d > dmx:
+                            dmx = d
+                        if d > thresh:
+                            lg += 1
+            if cnt > 0:
+                mins[j] = mn
+                maxs[j] = mx
+                means[j] = s / cnt
+            if dcnt > 0:
+                mean_rate[j] = ds / dcnt
+            max_rate[j] = dmx
+            large[j] = lg
+            valid[j] = cnt
+        return mins, maxs, means, mean_rate, max_rate, large, valid
+else:
+    _col_stats_jit = None
+
+
+if numba is not None:
+    # No fastmath here: it would let LLVM assume no NaNs and compile the
+    # gap-frame guard away, counting NaN samples into n and the sum.
+    # nogil so analyze_tracking's thread pool can run columns in
+    # parallel; the kernel only touches its array argument and scalars.
+    @numba.njit(cache=True, nogil=True)
+    def _diff_stats_jit(d, t0, t1, t2):
+        # Sum, max and the three threshold counts in one scan; the
+        # NumPy path needs five passes over the same column.
+        s = 0.0
+        mx = 0.0
+        c0 = 0
+        c1 = 0
+        c2 = 0
+        cnt = 0
+        for i in range(d.shape[0]):
+            v = d[i]
+            if np.isnan(v):
+                continue
+            cnt += 1
+            s += v
+            if v > mx:
+                mx = v
+            if v < t0:
+                c0 += 1
+            if v < t1:
+                c1 += 1
+            if v < t2:
+                c2 += 1
+        return cnt, s, mx, c0, c1, c2
+else:
+    _diff_stats_jit = None
+
+
+def diff_stats(d, thresholds=(0.001, 0.01, 0.1)):
+    """Fused stats for one column of absolute differences.
+
+    Returns (n, avg, max, count<t0, count<t1, count<t2) ignoring NaN,
+    or None when the column has no valid samples.
+    """
+    if _diff_stats_jit is not None:
+        n, s, mx, c0, c1, c2 = _diff_stats_jit(
+            np.ascontiguousarray(d, dtype=np.float64), *thresholds)
+        if n == 0:
+            return None
+        return n, s / n, mx, c0, c1, c2
+    d = d[~np.isnan(d)]
+    n = d.size
+    if n == 0:
+        return None
+    return (n, float(d.mean()), float(d.max()),
+            int((d < thresholds[0]).sum()), int((d < thresholds[1]).sum()),
+            int((d < thresholds[2]).sum()))
+
+
+def col_stats(X, thresh=0.1):
+    """Per-column ColStats over an (N, K) matrix with NaN gaps."""
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    if _col_stats_jit is not None:
+        return ColStats(*_col_stats_jit(X, thresh))
+    m = X.shape[1]
+    if X.shape[0] == 0:
+        # Zero-frame log: mirror the jit path instead of letting the
+        # nan-reductions raise on a zero-size axis.
+        return ColStats(np.full(m, np.nan), np.full(m, np.nan),
+                        np.full(m, np.nan), np.zeros(m), np.zeros(m),
+                        np.zeros(m, np.int64), np.zeros(m, np.int64))
+    valid = np.sum(~np.isnan(X), axis=0)
+    with warnings.catch_warnings():
+        # All-NaN columns are legal input; callers gate on `valid`.
+        warnings.simplefilter('ignore', RuntimeWarning)
+        mins = np.nanmin(X, axis=0)
+        maxs = np.nanmax(X, axis=0)
+        means = np.nanmean(X, axis=0)
+        diffs = np.abs(np.diff(X, axis=0))
+        mean_rate = np.nan_to_num(np.nanmean(diffs, axis=0))
+        max_rate = np.nan_to_num(np.nanmax(diffs, axis=0)) \
+            if diffs.size else np.zeros(X.shape[1])
+        large = np.nansum(diffs > thresh, axis=0).astype(np.int64)
+    return ColStats(mins, maxs, means, mean_rate, max_rate, large, valid)